@@ -122,6 +122,8 @@ void HttpServer::handle_client(int client_socket) {
     std::string response;
     if (method == "GET" && path == "/status") {
         response = handle_status_request();
+    } else if (method == "HEAD" && path == "/status") {
+        response = handle_status_head_request();
     } else if (method == "POST" && path == "/start") {
         response = handle_start_request(body);
     } else if (method == "POST" && path == "/stop") {
@@ -176,7 +178,7 @@ std::string HttpServer::create_json_response(const std::string& data, int status
     response << "Content-Type: application/json\r\n";
     response << "Content-Length: " << data.length() << "\r\n";
     response << "Access-Control-Allow-Origin: *\r\n";
-    response << "Access-Control-Allow-Methods: GET, POST, DELETE\r\n";
+    response << "Access-Control-Allow-Methods: GET, HEAD, POST, DELETE\r\n";
     response << "Access-Control-Allow-Headers: Content-Type\r\n";
     response << "\r\n";
     response << data;
@@ -218,6 +220,12 @@ std::string HttpServer::handle_status_request() {
     return create_json_response(json.str());
 }
 
+std::string HttpServer::handle_status_head_request() {
+    // Liveness probe: answering at all proves the agent is up, so skip
+    // collecting metrics and the process list
+    return create_json_response("");
+}
+
 std::string HttpServer::handle_start_request(const std::string& body) {
     std::string script_path = parse_json_field(body, "script_path");
     if (script_path.empty()) {
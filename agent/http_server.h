@@ -28,6 +28,7 @@ public:
     
     // Route handlers
     std::string handle_status_request();
+    std::string handle_status_head_request();
     std::string handle_start_request(const std::string& body);
     std::string handle_stop_request(const std::string& body);
     
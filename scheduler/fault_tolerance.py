@@ -4,14 +4,17 @@ Fault Tolerance Module for Micro-Orchestrator
 Implements automated failure detection and workload rescheduling
 """
 
-import json
+import sched
+import sqlite3
 import time
 import threading
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import requests
 from enum import Enum
 
@@ -22,53 +25,98 @@ class NodeStatus(Enum):
     DEGRADED = "degraded"
     UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
     """Health check information"""
-    last_check: datetime
+    last_check: float  # time.monotonic()
     consecutive_failures: int = 0
-    response_time: float = 0.0
+    response_time: int = 0  # microseconds
     status: NodeStatus = NodeStatus.UNKNOWN
+    cached_until: float = 0.0  # time.monotonic() until which the result is fresh
 
-@dataclass
+@dataclass(slots=True)
 class DesiredState:
     """Desired state for workload recovery"""
     workload_id: str
     script_path: str
     target_node: str
     status: str
-    created_at: datetime
+    created_at: str  # ISO 8601
     retry_count: int = 0
     max_retries: int = 3
+    next_retry_at: float = 0.0  # time.monotonic(); not persisted
 
 class FaultToleranceManager:
     """Manages fault tolerance and high availability features"""
     
-    def __init__(self, scheduler, state_file: str = "orchestrator_state.json"):
+    def __init__(self, scheduler, state_file: str = "orchestrator_state.db"):
+        self.logger = logging.getLogger(__name__)
         self.scheduler = scheduler
         self.state_file = Path(state_file)
         self.health_checks: Dict[str, HealthCheck] = {}
         self.desired_state: Dict[str, DesiredState] = {}
+        # node_key -> workload_ids targeting it, guarded by recovery_lock
+        self._by_node: Dict[str, Set[str]] = {}
         self.failed_workloads: Set[str] = set()
+        # Failed workloads with a start request in flight, guarded by recovery_lock
+        self._recoveries_in_flight: Set[str] = set()
         self.recovery_lock = threading.Lock()
         
+        # One background thread runs every periodic and event-driven job. Jobs hand
+        # network I/O to the probe pool and never wait on it, so queued write
+        # flushes run within write_delay instead of behind a slow node
+        self._wakeup = threading.Event()
+        self._sched = sched.scheduler(time.monotonic, self._sched_delay)
+        self._recovery_event: Optional[sched.Event] = None  # guarded by recovery_lock
+        
+        # Write-behind buffer: workload_id -> row to upsert, or None to delete.
+        # Guarded by recovery_lock and drained by _flush_writes in one transaction.
+        self._pending_writes: Dict[str, Optional[Tuple]] = {}
+        self._flush_event: Optional[sched.Event] = None  # guarded by recovery_lock
+        
+        # Guards health_checks; the scheduler's node map is read lock-free
+        self.health_lock = threading.Lock()
+        # Nodes with a probe queued or running, guarded by health_lock
+        self._probes_in_flight: Set[str] = set()
+        # Nodes whose agent predates HEAD /status and is probed with GET, guarded by health_lock
+        self._get_probe_nodes: Set[str] = set()
+        
         # Configuration
         self.health_check_interval = 3.0  # seconds
         self.failure_threshold = 2  # consecutive failures
         self.recovery_timeout = 30.0  # seconds
         self.max_retry_attempts = 3
+        self.probe_timeout = 2.0  # seconds
+        self.cache_ttl = 1.5  # seconds a successful probe result stays fresh
+        self.write_delay = 0.01  # seconds to batch state writes before flushing
         
-        # Start background threads
-        self.health_monitor_thread = threading.Thread(
-            target=self._health_monitor_loop, 
-            daemon=True
-        )
-        self.state_persistence_thread = threading.Thread(
-            target=self._state_persistence_loop, 
-            daemon=True
+        # Persistent pool so node probes run concurrently
+        self._probe_pool = ThreadPoolExecutor(max_workers=16)
+        
+        # Probes and restarts share the scheduler's pooled keep-alive connections
+        self._session = scheduler.http
+        
+        # Desired state lives in SQLite; each mutation writes only its own rows.
+        # The connection is shared across threads and guarded by _db_lock.
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.state_file), check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS workloads ('
+            'workload_id TEXT PRIMARY KEY, '
+            'script_path TEXT NOT NULL, '
+            'target_node TEXT NOT NULL, '
+            'status TEXT NOT NULL, '
+            'created_at TEXT NOT NULL, '
+            'retry_count INTEGER NOT NULL, '
+            'max_retries INTEGER NOT NULL)'
         )
-        self.recovery_thread = threading.Thread(
-            target=self._recovery_loop, 
+        self._db.commit()
+        
+        # Start background thread
+        self.sched_thread = threading.Thread(
+            target=self._run_sched, 
             daemon=True
         )
         
@@ -76,134 +124,233 @@ class FaultToleranceManager:
         self._load_state()
         
         # Start monitoring
-        self.health_monitor_thread.start()
-        self.state_persistence_thread.start()
-        self.recovery_thread.start()
+        self._sched.enter(0, 1, self._health_check_job)
+        self.sched_thread.start()
         
-        self.logger = logging.getLogger(__name__)
         self.logger.info("Fault Tolerance Manager initialized")
     
     def _load_state(self):
-        """Load persisted state from file"""
+        """Load persisted state from the database"""
         try:
-            if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    
-                # Restore desired state
-                for workload_data in data.get('workloads', []):
-                    workload = DesiredState(
-                        workload_id=workload_data['workload_id'],
-                        script_path=workload_data['script_path'],
-                        target_node=workload_data['target_node'],
-                        status=workload_data['status'],
-                        created_at=datetime.fromisoformat(workload_data['created_at']),
-                        retry_count=workload_data.get('retry_count', 0),
-                        max_retries=workload_data.get('max_retries', 3)
-                    )
-                    self.desired_state[workload.workload_id] = workload
-                
-                self.logger.info(f"Loaded {len(self.desired_state)} workloads from state file")
-        except Exception as e:
+            rows = self._db.execute(
+                'SELECT workload_id, script_path, target_node, status, '
+                'created_at, retry_count, max_retries FROM workloads'
+            ).fetchall()
+            
+            # Restore desired state
+            for row in rows:
+                workload = DesiredState(*row)
+                self.desired_state[workload.workload_id] = workload
+                self._by_node.setdefault(workload.target_node, set()).add(workload.workload_id)
+            
+            self.logger.info(f"Loaded {len(self.desired_state)} workloads from state database")
+        except sqlite3.Error as e:
             self.logger.error(f"Failed to load state: {e}")
     
-    def _save_state(self):
-        """Save current state to file"""
-        try:
+    def _save_workloads(self, workloads: List[DesiredState]):
+        """Queue workload upserts for the next flush; caller must hold recovery_lock"""
+        for w in workloads:
+            self._pending_writes[w.workload_id] = (
+                w.workload_id, w.script_path, w.target_node, w.status,
+                w.created_at, w.retry_count, w.max_retries
+            )
+        self._request_flush()
+    
+    def _delete_workload(self, workload_id: str):
+        """Queue a workload row deletion; caller must hold recovery_lock"""
+        self._pending_writes[workload_id] = None
+        self._request_flush()
+    
+    def _request_flush(self):
+        """Schedule a flush of queued writes; caller must hold recovery_lock"""
+        if self._flush_event is None:
+            self._flush_event = self._sched.enter(self.write_delay, 0, self._flush_writes)
+            self._wakeup.set()
+    
+    def _flush_writes(self):
+        """Write every queued upsert and delete in a single transaction"""
+        # Hold _db_lock across the swap so batches reach the database in order
+        with self._db_lock:
             with self.recovery_lock:
-                state_data = {
-                    'timestamp': datetime.now().isoformat(),
-                    'workloads': [
-                        {
-                            'workload_id': workload.workload_id,
-                            'script_path': workload.script_path,
-                            'target_node': workload.target_node,
-                            'status': workload.status,
-                            'created_at': workload.created_at.isoformat(),
-                            'retry_count': workload.retry_count,
-                            'max_retries': workload.max_retries
-                        }
-                        for workload in self.desired_state.values()
-                    ]
-                }
+                self._flush_event = None
+                pending, self._pending_writes = self._pending_writes, {}
+            if not pending:
+                return
             
-            with open(self.state_file, 'w') as f:
-                json.dump(state_data, f, indent=2)
-                
-        except Exception as e:
-            self.logger.error(f"Failed to save state: {e}")
+            try:
+                with self._db:
+                    self._db.executemany(
+                        'DELETE FROM workloads WHERE workload_id = ?',
+                        [(workload_id,) for workload_id, row in pending.items() if row is None]
+                    )
+                    self._db.executemany(
+                        'INSERT INTO workloads (workload_id, script_path, target_node, status, '
+                        'created_at, retry_count, max_retries) VALUES (?, ?, ?, ?, ?, ?, ?) '
+                        'ON CONFLICT(workload_id) DO UPDATE SET '
+                        'target_node = excluded.target_node, status = excluded.status, '
+                        'retry_count = excluded.retry_count',
+                        [row for row in pending.values() if row is not None]
+                    )
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to save state: {e}")
     
-    def _health_monitor_loop(self):
-        """Background thread for health monitoring"""
+    def _run_sched(self):
+        """Background thread driving health checks and recovery"""
         while True:
             try:
-                self._perform_health_checks()
-                time.sleep(self.health_check_interval)
+                self._sched.run()
             except Exception as e:
-                self.logger.error(f"Error in health monitoring: {e}")
-                time.sleep(5)
+                self.logger.error(f"Error in background scheduler: {e}")
+            # run() only returns once the queue is empty; wait for new work
+            self._wakeup.wait(5)
+            self._wakeup.clear()
+    
+    def _sched_delay(self, timeout: float):
+        """Sleep until the next job is due, or until new work is queued"""
+        if self._wakeup.wait(timeout):
+            self._wakeup.clear()
+    
+    def _health_check_job(self):
+        """Periodic health check job; reschedules itself"""
+        started = time.monotonic()
+        try:
+            self._perform_health_checks()
+            # Keep a fixed cadence no matter how long the round took
+            self._sched.enterabs(started + self.health_check_interval, 1, self._health_check_job)
+        except Exception as e:
+            self.logger.error(f"Error in health monitoring: {e}")
+            self._sched.enter(5, 1, self._health_check_job)
     
-    def _perform_health_checks(self):
+    def _perform_health_checks(self, force: bool = False):
         """Perform health checks on all registered nodes"""
-        with self.scheduler.node_lock:
-            for node_key, node in list(self.scheduler.nodes.items()):
-                self._check_node_health(node_key, node)
+        # Snapshot under the lock, probe without it; nodes with a fresh result are skipped
+        now = time.monotonic()
+        with self.health_lock:
+            # A node whose last probe has not finished is not probed again
+            targets = {
+                node_key: node for node_key, node in self.scheduler.nodes.items()
+                if node_key not in self._probes_in_flight
+                and self._is_check_due(node_key, now)
+            }
+            self._probes_in_flight.update(targets)
+        
+        futures = []
+        for node_key, node in targets.items():
+            future = self._probe_pool.submit(self._probe, node_key, node)
+            # Record each result as it lands, including ones that arrive after this round
+            future.add_done_callback(
+                lambda f, node_key=node_key, node=node: self._on_probe_done(node_key, node, f)
+            )
+            futures.append(future)
+        
+        # Periodic rounds only dispatch; a forced check waits so its caller sees fresh results
+        if force and futures:
+            _, not_done = wait(futures, timeout=self.probe_timeout + 1.0)
+            if not_done:
+                self.logger.warning(f"Health check round timed out waiting for {len(not_done)} nodes")
+    
+    def _on_probe_done(self, node_key: str, node, future: Future):
+        """Record a finished probe and release the node for the next round"""
+        try:
+            if not future.cancelled():
+                _, healthy, response_time, error_msg = future.result()
+                self.record_probe(node_key, node, healthy, response_time, error_msg)
+        except Exception as e:
+            self.logger.error(f"Error recording health check for {node_key}: {e}")
+        finally:
+            with self.health_lock:
+                self._probes_in_flight.discard(node_key)
     
-    def _check_node_health(self, node_key: str, node):
-        """Check health of a specific node"""
-        start_time = time.time()
+    def _is_check_due(self, node_key: str, now: float) -> bool:
+        """Whether a node should be probed this round; caller must hold health_lock"""
+        health_check = self.health_checks.get(node_key)
+        return health_check is None or now >= health_check.cached_until
+    
+    def _probe(self, node_key: str, node) -> Tuple[str, bool, int, Optional[str]]:
+        """Probe a node's status endpoint; only records whether the node needs GET probes"""
+        start_ns = time.perf_counter_ns()
+        
+        with self.health_lock:
+            use_get = node_key in self._get_probe_nodes
         
         try:
-            url = f"http://{node.host}:{node.port}/status"
-            response = requests.get(url, timeout=2.0)
-            
-            response_time = time.time() - start_time
+            # HEAD is enough for liveness and skips the process-list body
+            if use_get:
+                response = self._session.get(node.status_url, timeout=self.probe_timeout)
+            else:
+                response = self._session.head(node.status_url, timeout=self.probe_timeout)
+                if response.status_code in (404, 405, 501):
+                    # Older agents only route GET /status; probe this node with GET from now on
+                    with self.health_lock:
+                        self._get_probe_nodes.add(node_key)
+                    response = self._session.get(node.status_url, timeout=self.probe_timeout)
+            response_time = (time.perf_counter_ns() - start_ns) // 1000
             
             if response.status_code == 200:
-                # Node is healthy
-                if node_key not in self.health_checks:
-                    self.health_checks[node_key] = HealthCheck(
-                        last_check=datetime.now(),
-                        status=NodeStatus.ONLINE
-                    )
-                else:
-                    health_check = self.health_checks[node_key]
-                    health_check.last_check = datetime.now()
-                    health_check.consecutive_failures = 0
-                    health_check.response_time = response_time
-                    health_check.status = NodeStatus.ONLINE
-                
-                # Update node status
-                node.status = "online"
-                
-            else:
-                # Node is responding but with error
-                self._handle_node_failure(node_key, node, "HTTP error")
-                
+                return node_key, True, response_time, None
+            # Node is responding but with error
+            return node_key, False, response_time, "HTTP error"
+            
         except requests.RequestException as e:
             # Node is not responding
-            self._handle_node_failure(node_key, node, f"Connection error: {e}")
+            return node_key, False, (time.perf_counter_ns() - start_ns) // 1000, f"Connection error: {e}"
+    
+    def record_probe(self, node_key: str, node, healthy: bool,
+                     response_time: int, error_msg: Optional[str] = None):
+        """Record a status probe made by any caller and start recovery if the node went offline"""
+        with self.health_lock:
+            went_offline = self._check_node_health(node_key, node, healthy, response_time, error_msg)
+        
+        # Recovery takes recovery_lock, so trigger it outside health_lock
+        if went_offline:
+            self._trigger_recovery(node_key)
+    
+    def _check_node_health(self, node_key: str, node, healthy: bool,
+                           response_time: int, error_msg: Optional[str]) -> bool:
+        """Record a probe result; returns True if the node just went offline"""
+        if not healthy:
+            return self._handle_node_failure(node_key, node, error_msg)
+        
+        # Node is healthy
+        if node_key not in self.health_checks:
+            self.health_checks[node_key] = HealthCheck(
+                last_check=time.monotonic(),
+                response_time=response_time,
+                status=NodeStatus.ONLINE
+            )
+        else:
+            health_check = self.health_checks[node_key]
+            health_check.last_check = time.monotonic()
+            health_check.consecutive_failures = 0
+            health_check.response_time = response_time
+            health_check.status = NodeStatus.ONLINE
+        self.health_checks[node_key].cached_until = time.monotonic() + self.cache_ttl
+        
+        # Update node status
+        node.set_status("online")
+        return False
     
-    def _handle_node_failure(self, node_key: str, node, error_msg: str):
-        """Handle node failure detection"""
+    def _handle_node_failure(self, node_key: str, node, error_msg: str) -> bool:
+        """Handle node failure detection; returns True if the node just went offline"""
         if node_key not in self.health_checks:
             self.health_checks[node_key] = HealthCheck(
-                last_check=datetime.now(),
+                last_check=time.monotonic(),
                 consecutive_failures=1,
                 status=NodeStatus.OFFLINE
             )
         else:
             health_check = self.health_checks[node_key]
             health_check.consecutive_failures += 1
-            health_check.last_check = datetime.now()
+            health_check.last_check = time.monotonic()
             health_check.status = NodeStatus.OFFLINE
         
         # Mark node as offline if threshold exceeded
         if self.health_checks[node_key].consecutive_failures >= self.failure_threshold:
             if node.status != "offline":
                 self.logger.warning(f"Node {node_key} marked as offline: {error_msg}")
-                node.status = "offline"
-                self._trigger_recovery(node_key)
+                node.set_status("offline")
+                return True
+        return False
     
     def _trigger_recovery(self, failed_node_key: str):
         """Trigger recovery for workloads on failed node"""
@@ -211,25 +358,52 @@ class FaultToleranceManager:
             # Find workloads that were running on the failed node
             failed_workloads = []
             
-            for workload_id, workload in self.desired_state.items():
-                if (workload.target_node == failed_node_key and 
-                    workload.status == "running"):
+            for workload_id in self._by_node.get(failed_node_key, ()):
+                if self.desired_state[workload_id].status == "running":
                     failed_workloads.append(workload_id)
                     self.failed_workloads.add(workload_id)
                     self.logger.info(f"Workload {workload_id} marked for recovery")
             
             if failed_workloads:
                 self.logger.info(f"Triggering recovery for {len(failed_workloads)} workloads")
+                self._request_recovery()
     
-    def _recovery_loop(self):
-        """Background thread for workload recovery"""
-        while True:
+    def _request_recovery(self, delay: float = 0.0):
+        """Queue a recovery pass; caller must hold recovery_lock"""
+        due = time.monotonic() + delay
+        event = self._recovery_event
+        if event is not None:
+            if event.time <= due:
+                return
             try:
-                self._process_recovery_queue()
-                time.sleep(1)  # Check every second
-            except Exception as e:
-                self.logger.error(f"Error in recovery loop: {e}")
-                time.sleep(5)
+                self._sched.cancel(event)
+            except ValueError:
+                pass  # already running; it re-checks the queue when done
+        self._recovery_event = self._sched.enterabs(due, 0, self._recovery_job)
+        self._wakeup.set()
+    
+    def _recovery_job(self):
+        """Recovery job; queued when failures are reported"""
+        with self.recovery_lock:
+            self._recovery_event = None
+        
+        try:
+            self._process_recovery_queue()
+        except Exception as e:
+            self.logger.error(f"Error in recovery loop: {e}")
+        
+        with self.recovery_lock:
+            # Workloads with a start in flight are requeued by _on_recovery_done
+            waiting = self.failed_workloads - self._recoveries_in_flight
+            if waiting:
+                # Pending retries: wake for the earliest one, at most once a second
+                earliest = min(
+                    (self.desired_state[workload_id].next_retry_at
+                     for workload_id in waiting
+                     if workload_id in self.desired_state),
+                    default=0.0
+                )
+                self._request_recovery(max(1.0, earliest - time.monotonic()))
     
     def _process_recovery_queue(self):
         """Process the recovery queue"""
@@ -237,36 +411,67 @@ class FaultToleranceManager:
             if not self.failed_workloads:
                 return
             
-            # Get a healthy node for recovery
-            healthy_node = self._select_healthy_node()
-            if not healthy_node:
-                self.logger.warning("No healthy nodes available for recovery")
-                return
-            
-            # Process failed workloads
+            # Drop workloads that are gone or out of retries; the rest that are due form one batch
+            now = time.monotonic()
+            batch = []
             for workload_id in list(self.failed_workloads):
-                if self._attempt_workload_recovery(workload_id, healthy_node):
+                if workload_id in self._recoveries_in_flight:
+                    continue
+                workload = self._get_recoverable_workload(workload_id)
+                if workload is None:
                     self.failed_workloads.remove(workload_id)
+                elif now >= workload.next_retry_at:
+                    batch.append(workload)
+        
+        if not batch:
+            return
+        
+        # Get a healthy node for recovery
+        healthy_node = self._select_healthy_node()
+        node = self.scheduler.nodes.get(healthy_node) if healthy_node else None
+        if node is None:
+            self.logger.warning("No healthy nodes available for recovery")
+            return
+        
+        with self.recovery_lock:
+            self._recoveries_in_flight.update(workload.workload_id for workload in batch)
+        
+        # Start the batch on the probe pool; this thread only dispatches, so health
+        # checks and write flushes keep running while the starts are in flight
+        for workload in batch:
+            future = self._probe_pool.submit(self._start_workload_on_node, workload, node)
+            future.add_done_callback(
+                lambda f, workload=workload: self._on_recovery_done(workload, healthy_node, f)
+            )
+    
+    def _on_recovery_done(self, workload: DesiredState, target_node: str, future: Future):
+        """Record a finished recovery start and queue a retry if it failed"""
+        try:
+            success = not future.cancelled() and future.result()
+        except Exception as e:
+            self.logger.error(f"Error recovering workload {workload.workload_id}: {e}")
+            success = False
+        
+        with self.recovery_lock:
+            self._recoveries_in_flight.discard(workload.workload_id)
+            if self._attempt_workload_recovery(workload, target_node, success):
+                self.failed_workloads.discard(workload.workload_id)
+            elif workload.workload_id in self.failed_workloads:
+                self._request_recovery(max(0.0, workload.next_retry_at - time.monotonic()))
+            
+            # Skip workloads unregistered while their start was in flight
+            if self.desired_state.get(workload.workload_id) is workload:
+                self._save_workloads([workload])
     
     def _select_healthy_node(self) -> Optional[str]:
         """Select a healthy node for workload recovery"""
-        with self.scheduler.node_lock:
-            healthy_nodes = [
-                node_key for node_key, node in self.scheduler.nodes.items()
-                if node.status == "online" and node.cpu_usage < 80.0
-            ]
-            
-            if not healthy_nodes:
-                return None
-            
-            # Select node with lowest CPU usage
-            return min(healthy_nodes, key=lambda n: self.scheduler.nodes[n].cpu_usage)
+        return self.scheduler.select_least_loaded_node()
     
-    def _attempt_workload_recovery(self, workload_id: str, target_node: str) -> bool:
-        """Attempt to recover a specific workload"""
+    def _get_recoverable_workload(self, workload_id: str) -> Optional[DesiredState]:
+        """Return the workload if it should be retried; caller must hold recovery_lock"""
         if workload_id not in self.desired_state:
             self.logger.warning(f"Workload {workload_id} not found in desired state")
-            return True  # Remove from recovery queue
+            return None  # Remove from recovery queue
         
         workload = self.desired_state[workload_id]
         
@@ -274,35 +479,38 @@ class FaultToleranceManager:
         if workload.retry_count >= workload.max_retries:
             self.logger.error(f"Workload {workload_id} exceeded retry limit")
             workload.status = "failed"
-            return True  # Remove from recovery queue
+            self._save_workloads([workload])
+            return None  # Remove from recovery queue
         
-        try:
-            # Attempt to start workload on healthy node
-            node = self.scheduler.nodes[target_node]
-            success = self._start_workload_on_node(workload, node)
-            
-            if success:
-                workload.target_node = target_node
-                workload.status = "running"
-                workload.retry_count += 1
-                self.logger.info(f"Successfully recovered workload {workload_id} on {target_node}")
-                return True
-            else:
-                workload.retry_count += 1
-                self.logger.warning(f"Failed to recover workload {workload_id}, attempt {workload.retry_count}")
-                return False
-                
-        except Exception as e:
-            workload.retry_count += 1
-            self.logger.error(f"Error recovering workload {workload_id}: {e}")
-            return False
+        return workload
+    
+    def _attempt_workload_recovery(self, workload: DesiredState, target_node: str,
+                                   success: bool) -> bool:
+        """Record a recovery attempt; caller must hold recovery_lock"""
+        workload.retry_count += 1
+        
+        if success:
+            # Move the index entry unless the workload was unregistered meanwhile
+            registered = self.desired_state.get(workload.workload_id) is workload
+            if registered:
+                self._unindex_workload(workload)
+            workload.target_node = target_node
+            if registered:
+                self._by_node.setdefault(target_node, set()).add(workload.workload_id)
+            workload.status = "running"
+            self.logger.info(f"Successfully recovered workload {workload.workload_id} on {target_node}")
+            return True
+        
+        # Back off exponentially (1s, 2s, 4s, ...) so a struggling node is not hammered
+        workload.next_retry_at = time.monotonic() + 2 ** (workload.retry_count - 1)
+        self.logger.warning(f"Failed to recover workload {workload.workload_id}, attempt {workload.retry_count}")
+        return False
     
     def _start_workload_on_node(self, workload: DesiredState, node) -> bool:
         """Start a workload on a specific node"""
         try:
-            url = f"http://{node.host}:{node.port}/start"
-            response = requests.post(
-                url,
+            response = self._session.post(
+                node.start_url,
                 json={'script_path': workload.script_path},
                 timeout=10
             )
@@ -313,16 +521,6 @@ class FaultToleranceManager:
             self.logger.error(f"Error starting workload on {node.host}:{node.port}: {e}")
             return False
     
-    def _state_persistence_loop(self):
-        """Background thread for state persistence"""
-        while True:
-            try:
-                self._save_state()
-                time.sleep(30)  # Save every 30 seconds
-            except Exception as e:
-                self.logger.error(f"Error in state persistence: {e}")
-                time.sleep(60)
-    
     def register_workload(self, workload_id: str, script_path: str, target_node: str):
         """Register a new workload in the desired state"""
         with self.recovery_lock:
@@ -331,74 +529,115 @@ class FaultToleranceManager:
                 script_path=script_path,
                 target_node=target_node,
                 status="running",
-                created_at=datetime.now()
+                created_at=datetime.now().isoformat()
             )
+            previous = self.desired_state.get(workload_id)
+            if previous is not None:
+                self._unindex_workload(previous)
             self.desired_state[workload_id] = desired_workload
+            self._by_node.setdefault(target_node, set()).add(workload_id)
+            self._save_workloads([desired_workload])
             self.logger.info(f"Registered workload {workload_id} in desired state")
     
     def unregister_workload(self, workload_id: str):
         """Unregister a workload from the desired state"""
         with self.recovery_lock:
             if workload_id in self.desired_state:
-                del self.desired_state[workload_id]
+                self._unindex_workload(self.desired_state.pop(workload_id))
+                self._delete_workload(workload_id)
             if workload_id in self.failed_workloads:
                 self.failed_workloads.remove(workload_id)
             self.logger.info(f"Unregistered workload {workload_id} from desired state")
     
-    def get_health_summary(self) -> Dict:
-        """Get health summary for all nodes"""
-        summary = {
-            'total_nodes': len(self.scheduler.nodes),
-            'online_nodes': 0,
-            'offline_nodes': 0,
-            'degraded_nodes': 0,
+    def _unindex_workload(self, workload: DesiredState):
+        """Drop a workload from the per-node index; caller must hold recovery_lock"""
+        workload_ids = self._by_node.get(workload.target_node)
+        if workload_ids is not None:
+            workload_ids.discard(workload.workload_id)
+            if not workload_ids:
+                del self._by_node[workload.target_node]
+    
+    def get_health_counts(self) -> Dict:
+        """Get node and workload counts without per-node details"""
+        # The node map is copy-on-write, so one dereference gives a consistent view
+        nodes = self.scheduler.nodes
+        # Aggregate status counts in a single C-level pass
+        status_counts = Counter(node.status for node in nodes.values())
+        total_nodes = len(nodes)
+        
+        online_nodes = status_counts['online']
+        offline_nodes = status_counts['offline']
+        return {
+            'total_nodes': total_nodes,
+            'online_nodes': online_nodes,
+            'offline_nodes': offline_nodes,
+            'degraded_nodes': total_nodes - online_nodes - offline_nodes,
             'failed_workloads': len(self.failed_workloads),
-            'desired_workloads': len(self.desired_state),
-            'node_details': []
+            'desired_workloads': len(self.desired_state)
         }
+    
+    def _snapshot_health_checks(self) -> Dict[str, Tuple[float, int, int, NodeStatus]]:
+        """Copy each node's check results so callers can format them without health_lock"""
+        with self.health_lock:
+            return {
+                node_key: (hc.last_check, hc.consecutive_failures, hc.response_time, hc.status)
+                for node_key, hc in self.health_checks.items()
+            }
+    
+    def get_health_summary(self) -> Dict:
+        """Get health summary for all nodes"""
+        summary = self.get_health_counts()
+        summary['node_details'] = []
         
-        with self.scheduler.node_lock:
-            for node_key, node in self.scheduler.nodes.items():
-                health_check = self.health_checks.get(node_key)
-                node_detail = {
-                    'node_key': node_key,
-                    'host': node.host,
-                    'port': node.port,
-                    'status': node.status,
-                    'cpu_usage': node.cpu_usage,
-                    'memory_usage': node.memory_usage,
-                    'last_check': health_check.last_check.isoformat() if health_check else None,
-                    'consecutive_failures': health_check.consecutive_failures if health_check else 0,
-                    'response_time': health_check.response_time if health_check else None
-                }
-                summary['node_details'].append(node_detail)
-                
-                if node.status == "online":
-                    summary['online_nodes'] += 1
-                elif node.status == "offline":
-                    summary['offline_nodes'] += 1
-                else:
-                    summary['degraded_nodes'] += 1
+        # Base for converting monotonic check times to wall-clock for display
+        wall_base = datetime.now() - timedelta(seconds=time.monotonic())
+        
+        health_checks = self._snapshot_health_checks()
+        for node_key, node in self.scheduler.nodes.items():
+            health_check = health_checks.get(node_key)
+            node_detail = {
+                'node_key': node_key,
+                'host': node.host,
+                'port': node.port,
+                'status': node.status,
+                'cpu_usage': node.cpu_usage,
+                'memory_usage': node.memory_usage,
+                'last_check': (wall_base + timedelta(seconds=health_check[0])).isoformat() if health_check else None,
+                'consecutive_failures': health_check[1] if health_check else 0,
+                'response_time': health_check[2] / 1_000_000 if health_check else None
+            }
+            summary['node_details'].append(node_detail)
         
         return summary
     
-    def force_health_check(self):
+    def shutdown(self):
+        """Stop the probe pool and close the state database"""
+        self._probe_pool.shutdown(wait=False)
+        self._flush_writes()
+        with self._db_lock:
+            self._db.close()
+    
+    def force_health_check(self, details: bool = True):
         """Force an immediate health check on all nodes"""
-        self._perform_health_checks()
-        return self.get_health_summary()
+        self._perform_health_checks(force=True)
+        return self.get_health_summary() if details else self.get_health_counts()
     
     def get_recovery_metrics(self) -> Dict:
         """Get recovery metrics"""
+        wall_base = datetime.now() - timedelta(seconds=time.monotonic())
+        with self.recovery_lock:
+            failed_workloads = list(self.failed_workloads)
         return {
-            'failed_workloads': list(self.failed_workloads),
+            'failed_workloads': failed_workloads,
             'desired_state_count': len(self.desired_state),
             'health_checks': {
                 node_key: {
-                    'last_check': hc.last_check.isoformat(),
-                    'consecutive_failures': hc.consecutive_failures,
-                    'response_time': hc.response_time,
-                    'status': hc.status.value
+                    'last_check': (wall_base + timedelta(seconds=last_check)).isoformat(),
+                    'consecutive_failures': failures,
+                    'response_time': response_time / 1_000_000,
+                    'status': status.value
                 }
-                for node_key, hc in self.health_checks.items()
+                for node_key, (last_check, failures, response_time, status)
+                in self._snapshot_health_checks().items()
             }
         } 
\ No newline at end of file
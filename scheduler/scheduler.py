@@ -4,14 +4,20 @@ Micro-Orchestrator Python Scheduler
 Central component for managing workload distribution across Node Agents
 """
 
+import atexit
+import heapq
 import json
 import time
+import uuid
 import threading
 import logging
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from flask import Flask, request, jsonify
 import click
 from tabulate import tabulate
@@ -20,10 +26,37 @@ from colorama import init, Fore, Style
 # Import fault tolerance module
 from fault_tolerance import FaultToleranceManager
 
-# Initialize colorama for cross-platform colored output
+# Initialize colorama for cross-platform colored output; it strips ANSI codes off a terminal
 init()
 
-@dataclass
+# Color status labels and draw table borders only when writing to a terminal
+IS_TTY = sys.stdout.isatty()
+TABLE_FORMAT = 'grid' if IS_TTY else 'plain'
+
+# Number of workload shards; must be a power of two
+WORKLOAD_SHARDS = 16
+
+# Nodes at or above this CPU percentage are not given new workloads
+MAX_CPU_USAGE = 80.0
+
+# Pre-serialized body for empty listings, identical to jsonify([])
+EMPTY_JSON_LIST = b"[]\n"
+
+# Pre-rendered CLI status labels; statuses without an entry print as-is
+NODE_STATUS_LABELS = {
+    'online': f"{Fore.GREEN}online{Style.RESET_ALL}",
+    'offline': f"{Fore.RED}offline{Style.RESET_ALL}",
+    'degraded': f"{Fore.RED}degraded{Style.RESET_ALL}",
+    'unknown': f"{Fore.RED}unknown{Style.RESET_ALL}",
+} if IS_TTY else {}
+WORKLOAD_STATUS_LABELS = {
+    'running': f"{Fore.GREEN}running{Style.RESET_ALL}",
+    'pending': f"{Fore.YELLOW}pending{Style.RESET_ALL}",
+    'stopped': f"{Fore.YELLOW}stopped{Style.RESET_ALL}",
+    'failed': f"{Fore.YELLOW}failed{Style.RESET_ALL}",
+} if IS_TTY else {}
+
+@dataclass(slots=True)
 class NodeInfo:
     """Information about a Node Agent"""
     host: str
@@ -34,9 +67,46 @@ class NodeInfo:
     total_memory: int = 0
     available_memory: int = 0
     running_processes: int = 0
-    last_seen: Optional[datetime] = None
+    last_seen_ns: int = 0  # time.monotonic_ns() of the last contact, 0 if never
+    # Internal state, set up in __post_init__ and never serialized
+    status_url: str = field(init=False, repr=False, compare=False)
+    start_url: str = field(init=False, repr=False, compare=False)
+    lock: threading.Lock = field(init=False, repr=False, compare=False)
+    _json_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Endpoint URLs are hit on every probe; build them once per node
+        self.status_url = f"http://{self.host}:{self.port}/status"
+        self.start_url = f"http://{self.host}:{self.port}/start"
+        # Per-node lock for field updates, so unrelated nodes never contend
+        self.lock = threading.Lock()
+    
+    def to_dict(self) -> dict:
+        """Serialized node, rebuilt only after a field has changed"""
+        cache = self._json_cache
+        if cache is None:
+            with self.lock:
+                cache = {name: getattr(self, name) for name in NODE_API_FIELDS}
+                # Convert the monotonic stamp to wall-clock only when serializing
+                cache['last_seen'] = self.last_seen
+                self._json_cache = cache
+        return cache
+    
+    @property
+    def last_seen(self) -> Optional[datetime]:
+        """Wall-clock time of the last contact with the node"""
+        if not self.last_seen_ns:
+            return None
+        return datetime.now() - timedelta(microseconds=(time.monotonic_ns() - self.last_seen_ns) // 1000)
+    
+    def set_status(self, status: str):
+        """Set the node status, invalidating the cached serialization on change"""
+        if self.status != status:
+            with self.lock:
+                self.status = status
+                self._json_cache = None
 
-@dataclass
+@dataclass(slots=True)
 class WorkloadInfo:
     """Information about a workload"""
     id: str
@@ -47,6 +117,18 @@ class WorkloadInfo:
     status: str = "pending"
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
+    # Serialized form for the API, cleared whenever a field changes
+    _json_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_dict(self) -> dict:
+        """Serialized workload; caller must hold the workload's shard lock"""
+        if self._json_cache is None:
+            self._json_cache = {name: getattr(self, name) for name in WORKLOAD_API_FIELDS}
+        return self._json_cache
+
+# Fields exposed through the API; every value is immutable, so no deep copy is needed
+NODE_API_FIELDS = tuple(f.name for f in fields(NodeInfo) if f.init and f.name != 'last_seen_ns')
+WORKLOAD_API_FIELDS = tuple(f.name for f in fields(WorkloadInfo) if f.init)
 
 class MicroOrchestratorScheduler:
     """Main scheduler class for managing Node Agents and workloads"""
@@ -54,10 +136,37 @@ class MicroOrchestratorScheduler:
     def __init__(self, host: str = "0.0.0.0", port: int = 5000):
         self.host = host
         self.port = port
+        # Copy-on-write node map: writers swap in a new dict under node_lock,
+        # readers dereference it once and never lock
         self.nodes: Dict[str, NodeInfo] = {}
-        self.workloads: Dict[str, WorkloadInfo] = {}
+        self._nodes_snapshot: Tuple[Tuple[str, NodeInfo], ...] = ()
         self.node_lock = threading.Lock()
-        self.workload_lock = threading.Lock()
+        
+        # Lazy-deletion min-heap of (cpu_usage, node_key, epoch), guarded by load_lock
+        self.load_heap: List[Tuple[float, str, int]] = []
+        self._load_epoch: Dict[str, int] = {}
+        self.load_lock = threading.Lock()
+        
+        # Workloads are sharded by id so concurrent submits and stops rarely contend
+        self.workload_shards: List[Dict[str, WorkloadInfo]] = [{} for _ in range(WORKLOAD_SHARDS)]
+        self.workload_locks = [threading.Lock() for _ in range(WORKLOAD_SHARDS)]
+        
+        # Pool for fanning node RPCs out in parallel
+        self.executor = ThreadPoolExecutor(max_workers=32)
+        
+        # Status polls get their own pool so hung nodes never delay workload starts;
+        # a node with a poll still pending is skipped, guarded by poll_lock
+        self._poll_executor = ThreadPoolExecutor(max_workers=32)
+        self._polls_in_flight: Set[str] = set()
+        self.poll_lock = threading.Lock()
+        
+        # Shared HTTP session so node RPCs reuse pooled keep-alive connections
+        self.http = requests.Session()
+        self.http.mount('http://', HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=256,
+            max_retries=0
+        ))
         
         # Setup logging
         logging.basicConfig(
@@ -68,6 +177,8 @@ class MicroOrchestratorScheduler:
         
         # Setup Flask app
         self.app = Flask(__name__)
+        # Responses are built from cached dicts; skip re-sorting their keys on every dump
+        self.app.json.sort_keys = False
         self.setup_routes()
         
         # Initialize fault tolerance manager
@@ -86,15 +197,17 @@ class MicroOrchestratorScheduler:
             return jsonify({
                 'status': 'healthy',
                 'timestamp': datetime.now().isoformat(),
-                'nodes': len(self.nodes),
-                'workloads': len(self.workloads)
+                'nodes': len(self._nodes_snapshot),
+                'workloads': self._workload_count()
             })
         
         @self.app.route('/nodes', methods=['GET'])
         def list_nodes():
             """List all registered nodes"""
-            with self.node_lock:
-                return jsonify([asdict(node) for node in self.nodes.values()])
+            snapshot = self._nodes_snapshot
+            if not snapshot:
+                return self._empty_list_response()
+            return jsonify([node.to_dict() for _, node in snapshot])
         
         @self.app.route('/nodes', methods=['POST'])
         def register_node():
@@ -105,11 +218,15 @@ class MicroOrchestratorScheduler:
             
             node_key = f"{data['host']}:{data['port']}"
             with self.node_lock:
-                self.nodes[node_key] = NodeInfo(
+                nodes = dict(self.nodes)
+                nodes[node_key] = NodeInfo(
                     host=data['host'],
                     port=data['port'],
-                    last_seen=datetime.now()
+                    last_seen_ns=time.monotonic_ns()
                 )
+                self.nodes = nodes
+                self._nodes_snapshot = tuple(nodes.items())
+            self.update_node_load(node_key, 0.0)
             
             self.logger.info(f"Registered node: {node_key}")
             return jsonify({'message': f'Node {node_key} registered'})
@@ -117,8 +234,14 @@ class MicroOrchestratorScheduler:
         @self.app.route('/workloads', methods=['GET'])
         def list_workloads():
             """List all workloads"""
-            with self.workload_lock:
-                return jsonify([asdict(workload) for workload in self.workloads.values()])
+            if not self._workload_count():
+                return self._empty_list_response()
+            
+            workloads = []
+            for shard, lock in zip(self.workload_shards, self.workload_locks):
+                with lock:
+                    workloads.extend(workload.to_dict() for workload in shard.values())
+            return jsonify(workloads)
         
         @self.app.route('/workloads', methods=['POST'])
         def submit_workload():
@@ -127,7 +250,7 @@ class MicroOrchestratorScheduler:
             if not data or 'script_path' not in data:
                 return jsonify({'error': 'Missing script_path'}), 400
             
-            workload_id = f"workload_{int(time.time())}_{len(self.workloads)}"
+            workload_id = f"w_{uuid.uuid4().hex[:16]}"
             
             # Find best node for workload
             best_node = self._select_best_node()
@@ -141,40 +264,44 @@ class MicroOrchestratorScheduler:
                 node_port=best_node.port
             )
             
-            with self.workload_lock:
-                self.workloads[workload_id] = workload
+            shard, lock = self._shard(workload_id)
+            with lock:
+                shard[workload_id] = workload
             
-            # Start workload on selected node
-            success = self._start_workload_on_node(workload, best_node)
-            if success:
-                # Register with fault tolerance manager
-                node_key = f"{best_node.host}:{best_node.port}"
-                self.fault_tolerance.register_workload(workload_id, data['script_path'], node_key)
-                
-                self.logger.info(f"Started workload {workload_id} on {best_node.host}:{best_node.port}")
-                return jsonify({
-                    'workload_id': workload_id,
-                    'node': f"{best_node.host}:{best_node.port}",
-                    'status': 'started'
-                })
-            else:
-                # Remove failed workload
-                with self.workload_lock:
-                    self.workloads.pop(workload_id, None)
-                return jsonify({'error': 'Failed to start workload'}), 500
+            # Start it in the background; clients poll the status URL for the outcome
+            self.executor.submit(self._launch_workload, workload, best_node)
+            return jsonify({
+                'workload_id': workload_id,
+                'node': f"{best_node.host}:{best_node.port}",
+                'status': 'pending',
+                'status_url': f"/workloads/{workload_id}"
+            }), 202
+        
+        @self.app.route('/workloads/<workload_id>', methods=['GET'])
+        def get_workload(workload_id):
+            """Get a specific workload"""
+            shard, lock = self._shard(workload_id)
+            with lock:
+                workload = shard.get(workload_id)
+                if not workload:
+                    return jsonify({'error': 'Workload not found'}), 404
+                return jsonify(workload.to_dict())
         
         @self.app.route('/workloads/<workload_id>', methods=['DELETE'])
         def stop_workload(workload_id):
             """Stop a specific workload"""
-            with self.workload_lock:
-                workload = self.workloads.get(workload_id)
+            shard, lock = self._shard(workload_id)
+            with lock:
+                workload = shard.get(workload_id)
                 if not workload:
                     return jsonify({'error': 'Workload not found'}), 404
             
             success = self._stop_workload_on_node(workload)
             if success:
-                workload.status = "stopped"
-                workload.end_time = datetime.now()
+                with lock:
+                    workload.status = "stopped"
+                    workload.end_time = datetime.now()
+                    workload._json_cache = None
                 
                 # Unregister from fault tolerance manager
                 self.fault_tolerance.unregister_workload(workload_id)
@@ -190,10 +317,16 @@ class MicroOrchestratorScheduler:
             summary = self.fault_tolerance.get_health_summary()
             return jsonify(summary)
         
+        @self.app.route('/health/counts', methods=['GET'])
+        def health_counts():
+            """Get node and workload counts without per-node details"""
+            return jsonify(self.fault_tolerance.get_health_counts())
+        
         @self.app.route('/health/check', methods=['POST'])
         def force_health_check():
             """Force an immediate health check"""
-            summary = self.fault_tolerance.force_health_check()
+            details = request.args.get('details', 'true').lower() != 'false'
+            summary = self.fault_tolerance.force_health_check(details=details)
             return jsonify(summary)
         
         @self.app.route('/recovery/metrics', methods=['GET'])
@@ -202,35 +335,103 @@ class MicroOrchestratorScheduler:
             metrics = self.fault_tolerance.get_recovery_metrics()
             return jsonify(metrics)
     
+    def _empty_list_response(self):
+        """Return an empty JSON list without running the encoder"""
+        return self.app.response_class(EMPTY_JSON_LIST, mimetype='application/json')
+    
+    def _shard(self, workload_id: str) -> Tuple[Dict[str, WorkloadInfo], threading.Lock]:
+        """Return the workload shard and its lock for a workload id"""
+        index = hash(workload_id) & (WORKLOAD_SHARDS - 1)
+        return self.workload_shards[index], self.workload_locks[index]
+    
+    def _workload_count(self) -> int:
+        """Total number of workloads across all shards"""
+        return sum(len(shard) for shard in self.workload_shards)
+    
     def _select_best_node(self) -> Optional[NodeInfo]:
         """Select the best node for a new workload based on load balancing"""
-        with self.node_lock:
-            available_nodes = [
-                node for node in self.nodes.values()
-                if node.status == "online" and node.cpu_usage < 80.0
-            ]
+        node_key = self.select_least_loaded_node()
+        return self.nodes.get(node_key) if node_key else None
+    
+    def update_node_load(self, node_key: str, cpu_usage: float):
+        """Record a node's latest CPU usage, superseding its older heap entries"""
+        with self.load_lock:
+            epoch = self._load_epoch.get(node_key, 0) + 1
+            self._load_epoch[node_key] = epoch
+            heapq.heappush(self.load_heap, (cpu_usage, node_key, epoch))
             
-            if not available_nodes:
-                return None
+            # Superseded entries above the minimum never surface; compact them away
+            # so the heap stays proportional to the fleet instead of to update count
+            if len(self.load_heap) > 2 * len(self._load_epoch) + 64:
+                load_epoch = self._load_epoch
+                self.load_heap = [
+                    entry for entry in self.load_heap
+                    if load_epoch.get(entry[1]) == entry[2]
+                ]
+                heapq.heapify(self.load_heap)
+    
+    def select_least_loaded_node(self) -> Optional[str]:
+        """Return the key of the online node with the lowest CPU usage below MAX_CPU_USAGE"""
+        with self.load_lock:
+            nodes = self.nodes
+            skipped = []
+            selected = None
             
-            # Simple load balancing: select node with lowest CPU usage
-            return min(available_nodes, key=lambda n: n.cpu_usage)
+            # Pop to the lowest-CPU online node, discarding entries superseded by newer loads
+            while self.load_heap:
+                cpu_usage, node_key, epoch = self.load_heap[0]
+                if node_key not in nodes or self._load_epoch.get(node_key) != epoch:
+                    heapq.heappop(self.load_heap)
+                    continue
+                if cpu_usage >= MAX_CPU_USAGE:
+                    break  # every remaining node is at least this loaded
+                if nodes[node_key].status == "online":
+                    selected = node_key
+                    break
+                skipped.append(heapq.heappop(self.load_heap))
+            
+            # Offline nodes keep their current entry for when they come back
+            for entry in skipped:
+                heapq.heappush(self.load_heap, entry)
+            
+            return selected
+    
+    def _launch_workload(self, workload: WorkloadInfo, node: NodeInfo):
+        """Start a submitted workload and register it, or mark it failed"""
+        # Runs on the executor with its future discarded, so nothing may escape unlogged
+        try:
+            if self._start_workload_on_node(workload, node):
+                # Register with fault tolerance manager
+                node_key = f"{node.host}:{node.port}"
+                self.fault_tolerance.register_workload(workload.id, workload.script_path, node_key)
+                self.logger.info(f"Started workload {workload.id} on {node_key}")
+                return
+        except Exception as e:
+            self.logger.error(f"Error launching workload {workload.id}: {e}")
+        
+        _, lock = self._shard(workload.id)
+        with lock:
+            workload.status = "failed"
+            workload.end_time = datetime.now()
+            workload._json_cache = None
     
     def _start_workload_on_node(self, workload: WorkloadInfo, node: NodeInfo) -> bool:
         """Start a workload on a specific node"""
         try:
-            url = f"http://{node.host}:{node.port}"
-            response = requests.post(
-                f"{url}/start",
+            response = self.http.post(
+                node.start_url,
                 json={'script_path': workload.script_path},
                 timeout=10
             )
             
             if response.status_code == 200:
                 data = response.json()
-                workload.pid = data.get('pid')
-                workload.status = "running"
-                workload.start_time = datetime.now()
+                _, lock = self._shard(workload.id)
+                with lock:
+                    workload.pid = data.get('pid')
+                    workload.status = "running"
+                    workload.start_time = datetime.now()
+                    workload._json_cache = None
                 return True
             else:
                 self.logger.error(f"Failed to start workload on {node.host}:{node.port}")
@@ -247,7 +448,7 @@ class MicroOrchestratorScheduler:
         
         try:
             url = f"http://{workload.node_host}:{workload.node_port}"
-            response = requests.post(
+            response = self.http.post(
                 f"{url}/stop",
                 json={'pid': workload.pid},
                 timeout=10
@@ -263,46 +464,114 @@ class MicroOrchestratorScheduler:
         """Background thread to monitor node health"""
         while True:
             try:
-                with self.node_lock:
-                    for node_key, node in list(self.nodes.items()):
-                        self._update_node_status(node)
+                started = time.monotonic()
+                # Hand the polls to the pool and move on; replies land as they arrive
+                with self.poll_lock:
+                    targets = [
+                        (node_key, node) for node_key, node in self._nodes_snapshot
+                        if node_key not in self._polls_in_flight
+                    ]
+                    self._polls_in_flight.update(node_key for node_key, _ in targets)
+                for node_key, node in targets:
+                    self._poll_executor.submit(self._poll_node, node_key, node)
                 
-                time.sleep(30)  # Check every 30 seconds
+                # Check every 30 seconds, measured from the start of the round
+                time.sleep(max(0.0, started + 30 - time.monotonic()))
                 
             except Exception as e:
                 self.logger.error(f"Error in node monitoring: {e}")
                 time.sleep(60)
     
+    def _poll_node(self, node_key: str, node: NodeInfo):
+        """Run one status poll and release the node for the next round"""
+        try:
+            self._update_node_status(node)
+        except Exception as e:
+            self.logger.error(f"Error polling node {node_key}: {e}")
+        finally:
+            with self.poll_lock:
+                self._polls_in_flight.discard(node_key)
+    
     def _update_node_status(self, node: NodeInfo):
         """Update status of a specific node"""
+        node_key = f"{node.host}:{node.port}"
+        start_ns = time.perf_counter_ns()
         try:
-            url = f"http://{node.host}:{node.port}/status"
-            response = requests.get(url, timeout=5)
+            response = self.http.get(node.status_url, timeout=5)
+            response_time = (time.perf_counter_ns() - start_ns) // 1000
             
             if response.status_code == 200:
                 data = response.json()
-                node.status = "online"
-                node.cpu_usage = data.get('cpu_usage', 0.0)
-                node.memory_usage = data.get('memory_usage', 0.0)
-                node.total_memory = data.get('total_memory', 0)
-                node.available_memory = data.get('available_memory', 0)
-                node.running_processes = data.get('running_processes', 0)
-                node.last_seen = datetime.now()
+                with node.lock:
+                    node.status = "online"
+                    node.cpu_usage = data.get('cpu_usage', 0.0)
+                    node.memory_usage = data.get('memory_usage', 0.0)
+                    node.total_memory = data.get('total_memory', 0)
+                    node.available_memory = data.get('available_memory', 0)
+                    node.running_processes = data.get('running_processes', 0)
+                    node.last_seen_ns = time.monotonic_ns()
+                    node._json_cache = None
+                self.update_node_load(node_key, node.cpu_usage)
+                # A full status poll doubles as a health probe, so the next HEAD is skipped
+                self.fault_tolerance.record_probe(node_key, node, True, response_time)
             else:
-                node.status = "offline"
+                self.fault_tolerance.record_probe(node_key, node, False, response_time, "HTTP error")
                 
-        except requests.RequestException:
-            node.status = "offline"
+        except requests.RequestException as e:
+            response_time = (time.perf_counter_ns() - start_ns) // 1000
+            self.fault_tolerance.record_probe(node_key, node, False, response_time, f"Connection error: {e}")
     
     def run(self):
         """Start the scheduler"""
         self.logger.info(f"Starting Micro-Orchestrator Scheduler on {self.host}:{self.port}")
-        self.app.run(host=self.host, port=self.port, debug=False)
+        try:
+            # Serve each request on its own thread so a slow node RPC never blocks other handlers
+            self.app.run(host=self.host, port=self.port, debug=False, threaded=True)
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """Stop background work and release pooled connections"""
+        self.fault_tolerance.shutdown()
+        self.executor.shutdown(wait=False)
+        self._poll_executor.shutdown(wait=False)
+        self.http.close()
+
+def create_app() -> Flask:
+    """Build a scheduler and return its Flask app for a WSGI server such as gunicorn"""
+    # All state is in-process, so serve it from a single worker process
+    scheduler = MicroOrchestratorScheduler()
+    atexit.register(scheduler.shutdown)
+    return scheduler.app
+
+def _label_column(table_data: List[list], column: int, labels: Dict[str, str]):
+    """Swap one column of a plain table for its pre-rendered labels before printing"""
+    for row in table_data:
+        row[column] = labels.get(row[column], row[column])
+
+# CLI requests share one keep-alive session; every call is bounded by a timeout
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_request_timeout = 5.0
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """GET from the scheduler with the CLI timeout"""
+    return _session.get(url, timeout=_request_timeout, **kwargs)
+
+def _post(url: str, **kwargs) -> requests.Response:
+    """POST to the scheduler with the CLI timeout"""
+    return _session.post(url, timeout=_request_timeout, **kwargs)
+
+def _delete(url: str, **kwargs) -> requests.Response:
+    """DELETE on the scheduler with the CLI timeout"""
+    return _session.delete(url, timeout=_request_timeout, **kwargs)
 
 @click.group()
-def cli():
+@click.option('--timeout', default=5.0, help='Seconds to wait for the scheduler')
+def cli(timeout):
     """Micro-Orchestrator Scheduler CLI"""
-    pass
+    global _request_timeout
+    _request_timeout = timeout
 
 @cli.command()
 @click.option('--host', default='0.0.0.0', help='Host to bind to')
@@ -318,7 +587,7 @@ def start(host, port):
 def status(host, port):
     """Show scheduler status"""
     try:
-        response = requests.get(f"http://{host}:{port}/health")
+        response = _get(f"http://{host}:{port}/health")
         if response.status_code == 200:
             data = response.json()
             print(f"{Fore.GREEN}✓ Scheduler is healthy{Style.RESET_ALL}")
@@ -335,23 +604,24 @@ def status(host, port):
 def nodes(host, port):
     """List all nodes"""
     try:
-        response = requests.get(f"http://{host}:{port}/nodes")
+        response = _get(f"http://{host}:{port}/nodes")
         if response.status_code == 200:
             nodes_data = response.json()
             if nodes_data:
                 headers = ['Host', 'Port', 'Status', 'CPU %', 'Memory %', 'Processes']
-                table_data = []
-                for node in nodes_data:
-                    status_color = Fore.GREEN if node['status'] == 'online' else Fore.RED
-                    table_data.append([
+                table_data = [
+                    [
                         node['host'],
                         node['port'],
-                        f"{status_color}{node['status']}{Style.RESET_ALL}",
-                        f"{node['cpu_usage']:.1f}",
-                        f"{node['memory_usage']:.1f}",
+                        node['status'],
+                        node['cpu_usage'],
+                        node['memory_usage'],
                         node['running_processes']
-                    ])
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                    ]
+                    for node in nodes_data
+                ]
+                _label_column(table_data, 2, NODE_STATUS_LABELS)
+                print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT, floatfmt='.1f'))
             else:
                 print("No nodes registered")
         else:
@@ -365,23 +635,24 @@ def nodes(host, port):
 def workloads(host, port):
     """List all workloads"""
     try:
-        response = requests.get(f"http://{host}:{port}/workloads")
+        response = _get(f"http://{host}:{port}/workloads")
         if response.status_code == 200:
             workloads_data = response.json()
             if workloads_data:
                 headers = ['ID', 'Script', 'Node', 'Status', 'PID', 'Start Time']
-                table_data = []
-                for workload in workloads_data:
-                    status_color = Fore.GREEN if workload['status'] == 'running' else Fore.YELLOW
-                    table_data.append([
+                table_data = [
+                    [
                         workload['id'],
                         workload['script_path'],
                         f"{workload['node_host']}:{workload['node_port']}",
-                        f"{status_color}{workload['status']}{Style.RESET_ALL}",
+                        workload['status'],
                         workload.get('pid', '-'),
                         workload.get('start_time', '-')
-                    ])
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                    ]
+                    for workload in workloads_data
+                ]
+                _label_column(table_data, 3, WORKLOAD_STATUS_LABELS)
+                print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT))
             else:
                 print("No workloads")
         else:
@@ -396,15 +667,16 @@ def workloads(host, port):
 def submit(script_path, host, port):
     """Submit a new workload"""
     try:
-        response = requests.post(
+        response = _post(
             f"http://{host}:{port}/workloads",
             json={'script_path': script_path}
         )
-        if response.status_code == 200:
+        if response.status_code in (200, 202):
             data = response.json()
             print(f"{Fore.GREEN}✓ Workload submitted successfully{Style.RESET_ALL}")
             print(f"Workload ID: {data['workload_id']}")
             print(f"Node: {data['node']}")
+            print(f"Status: {data['status']}")
         else:
             error_data = response.json()
             print(f"{Fore.RED}✗ Failed to submit workload: {error_data.get('error', 'Unknown error')}{Style.RESET_ALL}")
@@ -418,7 +690,7 @@ def submit(script_path, host, port):
 def stop(workload_id, host, port):
     """Stop a workload"""
     try:
-        response = requests.delete(f"http://{host}:{port}/workloads/{workload_id}")
+        response = _delete(f"http://{host}:{port}/workloads/{workload_id}")
         if response.status_code == 200:
             print(f"{Fore.GREEN}✓ Workload {workload_id} stopped{Style.RESET_ALL}")
         else:
@@ -433,7 +705,7 @@ def stop(workload_id, host, port):
 def health(host, port):
     """Show comprehensive health summary"""
     try:
-        response = requests.get(f"http://{host}:{port}/health/summary")
+        response = _get(f"http://{host}:{port}/health/summary")
         if response.status_code == 200:
             data = response.json()
             print(f"{Fore.BLUE}=== Health Summary ==={Style.RESET_ALL}")
@@ -446,18 +718,19 @@ def health(host, port):
             if data['node_details']:
                 print(f"\n{Fore.BLUE}=== Node Details ==={Style.RESET_ALL}")
                 headers = ['Node', 'Status', 'CPU %', 'Memory %', 'Failures', 'Response Time']
-                table_data = []
-                for node in data['node_details']:
-                    status_color = Fore.GREEN if node['status'] == 'online' else Fore.RED
-                    table_data.append([
+                table_data = [
+                    [
                         f"{node['host']}:{node['port']}",
-                        f"{status_color}{node['status']}{Style.RESET_ALL}",
-                        f"{node['cpu_usage']:.1f}",
-                        f"{node['memory_usage']:.1f}",
+                        node['status'],
+                        node['cpu_usage'],
+                        node['memory_usage'],
                         node['consecutive_failures'],
                         f"{node['response_time']:.3f}s" if node['response_time'] else "N/A"
-                    ])
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                    ]
+                    for node in data['node_details']
+                ]
+                _label_column(table_data, 1, NODE_STATUS_LABELS)
+                print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT, floatfmt='.1f'))
         else:
             print(f"{Fore.RED}Failed to get health summary{Style.RESET_ALL}")
     except requests.RequestException:
@@ -469,7 +742,7 @@ def health(host, port):
 def recovery(host, port):
     """Show recovery metrics"""
     try:
-        response = requests.get(f"http://{host}:{port}/recovery/metrics")
+        response = _get(f"http://{host}:{port}/recovery/metrics")
         if response.status_code == 200:
             data = response.json()
             print(f"{Fore.BLUE}=== Recovery Metrics ==={Style.RESET_ALL}")
@@ -484,8 +757,7 @@ def recovery(host, port):
             if data['health_checks']:
                 print(f"\n{Fore.BLUE}Health Check Details:{Style.RESET_ALL}")
                 for node_key, health in data['health_checks'].items():
-                    status_color = Fore.GREEN if health['status'] == 'online' else Fore.RED
-                    print(f"  {node_key}: {status_color}{health['status']}{Style.RESET_ALL} "
+                    print(f"  {node_key}: {NODE_STATUS_LABELS.get(health['status'], health['status'])} "
                           f"(Failures: {health['consecutive_failures']}, "
                           f"Response: {health['response_time']:.3f}s)")
         else:
@@ -499,7 +771,7 @@ def recovery(host, port):
 def check(host, port):
     """Force immediate health check"""
     try:
-        response = requests.post(f"http://{host}:{port}/health/check")
+        response = _post(f"http://{host}:{port}/health/check", params={'details': 'false'})
         if response.status_code == 200:
             data = response.json()
             print(f"{Fore.GREEN}✓ Health check completed{Style.RESET_ALL}")
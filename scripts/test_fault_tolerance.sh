@@ -130,7 +130,7 @@ for i in {1..3}; do
         -d "{\"script_path\": \"../scripts/sample_workload.sh\"}")
     
     if echo "$WORKLOAD_RESPONSE" | grep -q "workload_id"; then
-        WORKLOAD_ID=$(echo "$WORKLOAD_RESPONSE" | grep -o 'workload_[0-9]*_[0-9]*' | head -1)
+        WORKLOAD_ID=$(echo "$WORKLOAD_RESPONSE" | grep -o 'w_[0-9a-f]\{16\}' | head -1)
         WORKLOAD_IDS+=("$WORKLOAD_ID")
         print_status "PASS" "Workload $i submitted successfully (ID: $WORKLOAD_ID)"
     else
@@ -174,7 +174,7 @@ fi
 # Test 5: Recovery Metrics
 print_status "INFO" "Test 5: Recovery Metrics"
 RECOVERY_RESPONSE=$(curl -s http://localhost:5000/recovery/metrics)
-FAILED_WORKLOADS=$(echo "$RECOVERY_RESPONSE" | grep -o '"failed_workloads":\[[^]]*\]' | grep -o 'workload_[^,]*' | wc -l)
+FAILED_WORKLOADS=$(echo "$RECOVERY_RESPONSE" | grep -o '"failed_workloads":\[[^]]*\]' | grep -o 'w_[0-9a-f]\{16\}' | wc -l)
 if [ "$FAILED_WORKLOADS" -ge 3 ]; then
     print_status "PASS" "Recovery metrics working ($FAILED_WORKLOADS failed workloads detected)"
 else
@@ -214,12 +214,14 @@ fi
 
 # Test 7: State Persistence
 print_status "INFO" "Test 7: State Persistence"
-if [ -f "orchestrator_state.json" ]; then
-    print_status "PASS" "State persistence working (orchestrator_state.json exists)"
-    echo "State file contents:"
-    head -20 orchestrator_state.json
+if [ -f "orchestrator_state.db" ]; then
+    print_status "PASS" "State persistence working (orchestrator_state.db exists)"
+    if command -v sqlite3 > /dev/null; then
+        echo "State database contents:"
+        sqlite3 orchestrator_state.db 'SELECT * FROM workloads' | head -20
+    fi
 else
-    print_status "FAIL" "State persistence failed (orchestrator_state.json not found)"
+    print_status "FAIL" "State persistence failed (orchestrator_state.db not found)"
 fi
 
 # Test 8: CLI Health Commands
@@ -258,7 +260,7 @@ NEW_WORKLOAD_RESPONSE=$(curl -s -X POST http://localhost:5000/workloads \
     -d '{"script_path": "../scripts/memory_workload.sh"}')
 
 if echo "$NEW_WORKLOAD_RESPONSE" | grep -q "workload_id"; then
-    NEW_WORKLOAD_ID=$(echo "$NEW_WORKLOAD_RESPONSE" | grep -o 'workload_[0-9]*_[0-9]*' | head -1)
+    NEW_WORKLOAD_ID=$(echo "$NEW_WORKLOAD_RESPONSE" | grep -o 'w_[0-9a-f]\{16\}' | head -1)
     print_status "PASS" "New workload submitted for performance test (ID: $NEW_WORKLOAD_ID)"
     
     # Wait for workload to start
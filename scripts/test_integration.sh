@@ -149,7 +149,7 @@ WORKLOAD_RESPONSE=$(curl -s -X POST http://localhost:5000/workloads \
     -d '{"script_path": "../scripts/sample_workload.sh"}')
 if echo "$WORKLOAD_RESPONSE" | grep -q "workload_id"; then
     print_status "PASS" "Workload submitted successfully"
-    WORKLOAD_ID=$(echo "$WORKLOAD_RESPONSE" | grep -o 'workload_[0-9]*_[0-9]*' | head -1)
+    WORKLOAD_ID=$(echo "$WORKLOAD_RESPONSE" | grep -o 'w_[0-9a-f]\{16\}' | head -1)
     echo "Workload ID: $WORKLOAD_ID"
 else
     print_status "FAIL" "Workload submission failed"
@@ -201,7 +201,7 @@ print_status "INFO" "Testing workload submission via CLI..."
 CLI_SUBMIT=$(python3 scheduler.py submit ../scripts/memory_workload.sh --host localhost --port 5000 2>/dev/null)
 if echo "$CLI_SUBMIT" | grep -q "submitted successfully"; then
     print_status "PASS" "CLI workload submission works"
-    CLI_WORKLOAD_ID=$(echo "$CLI_SUBMIT" | grep -o 'workload_[0-9]*_[0-9]*' | head -1)
+    CLI_WORKLOAD_ID=$(echo "$CLI_SUBMIT" | grep -o 'w_[0-9a-f]\{16\}' | head -1)
 else
     print_status "FAIL" "CLI workload submission failed"
 fi
@@ -257,7 +257,7 @@ echo
 print_status "INFO" "Cleaning up..."
 
 # Stop all workloads
-WORKLOADS_TO_STOP=$(curl -s http://localhost:5000/workloads | grep -o 'workload_[0-9]*_[0-9]*')
+WORKLOADS_TO_STOP=$(curl -s http://localhost:5000/workloads | grep -o 'w_[0-9a-f]\{16\}')
 for workload_id in $WORKLOADS_TO_STOP; do
     curl -s -X DELETE http://localhost:5000/workloads/$workload_id > /dev/null
 done